@@ -69,10 +69,15 @@ class MyModule(torch.nn.Module):
     def forward(self, x, y):
         return torch.nn.functional.relu(self.lin(x + y), inplace=True)
 
+# The example inputs are created once and reused by the examples below
+# that expect the same shapes.
+example_args = (torch.randn(8, 100), torch.randn(8, 100))
+
 mod = MyModule()
-exported_mod = export(mod, (torch.randn(8, 100), torch.randn(8, 100)))
+# ``strict=False`` is explained in the Non-Strict Export section below
+exported_mod = export(mod, example_args, strict=False)
 print(type(exported_mod))
-print(exported_mod.module()(torch.randn(8, 100), torch.randn(8, 100)))
+print(exported_mod.module()(*example_args))
 
 
 ######################################################################
@@ -87,16 +92,22 @@ print(exported_mod.module()(torch.randn(8, 100), torch.randn(8, 100)))
 #
 # The ``graph_module`` attribute is the ``GraphModule`` that wraps the ``graph`` attribute
 # so that it can be ran as a ``torch.nn.Module``.
+#
+# ``graph.print_tabular()`` prints one row per node of the graph, which is a compact
+# way to inspect which operators were captured. We use it throughout this tutorial
+# whenever we only need to look at the nodes of a graph.
 
-print(exported_mod)
+exported_mod.graph.print_tabular()
 print(exported_mod.graph_module)
 
 ######################################################################
 # The printed code shows that FX graph only contains ATen-level ops (such as ``torch.ops.aten``)
 # and that mutations were removed. For example, the mutating op ``torch.nn.functional.relu(..., inplace=True)``
 # is represented in the printed code by ``torch.ops.aten.relu.default``, which does not mutate.
-# Future uses of input to the original mutating ``relu`` op are replaced by the additional new output
-# of the replacement non-mutating ``relu`` op.
+# Since the in-place ``relu`` only mutates an intermediate value (the output of ``self.lin``),
+# functionalization does not add any output for it, and the module exports to the same graph
+# as it would with an out-of-place ``relu``. Only mutations of graph inputs, such as user
+# inputs or buffers, are returned as additional outputs of the graph.
 #
 # Other attributes of interest in ``ExportedProgram`` include:
 #
@@ -123,22 +134,12 @@ print(exported_mod.graph_signature)
 #
 # A graph break is necessary in cases such as:
 #
-# - data-dependent control flow
-
-class Bad1(torch.nn.Module):
-    def forward(self, x):
-        if x.sum() > 0:
-            return torch.sin(x)
-        return torch.cos(x)
+# - data-dependent control flow, such as ``if x.sum() > 0:`` (we show how to
+#   express this with the ``cond`` op in the `Control Flow Ops`_ section below)
+#
+# - accessing tensor data with ``.data``
 
 import traceback as tb
-try:
-    export(Bad1(), (torch.randn(3, 3),))
-except Exception:
-    tb.print_exc()
-
-######################################################################
-# - accessing tensor data with ``.data``
 
 class Bad2(torch.nn.Module):
     def forward(self, x):
@@ -220,7 +221,7 @@ class Bad3(torch.nn.Module):
         return x + id(x)
 
 bad3_nonstrict = export(Bad3(), (torch.randn(3, 3),), strict=False)
-print(bad3_nonstrict)
+bad3_nonstrict.graph.print_tabular()
 print(bad3_nonstrict.module()(torch.ones(3, 3)))
 
 ######################################################################
@@ -239,6 +240,13 @@ class Bad4(torch.nn.Module):
 bad4_nonstrict = export(Bad4(), (torch.randn(3, 3),), strict=False)
 print(bad4_nonstrict.module()(torch.ones(3, 3)))
 
+######################################################################
+# Non-strict mode also skips TorchDynamo's bytecode analysis, which makes
+# exporting cheaper. For modules that only perform tensor operations, such as
+# ``MyModule`` above, that analysis does not buy any additional guarantees, so
+# the rest of this tutorial exports such modules with ``strict=False``.
+# Strict mode is best reserved for modules with Python control flow, where
+# TorchDynamo's soundness guarantees matter.
 
 ######################################################################
 # However, there are still some features that require rewrites to the original
@@ -250,21 +258,25 @@ print(bad4_nonstrict.module()(torch.ones(3, 3)))
 #
 # ``torch.export`` actually does support data-dependent control flow.
 # But these need to be expressed using control flow ops. For example,
-# we can fix the control flow example above using the ``cond`` op, like so:
+# we can write the data-dependent ``if`` statement from above using the ``cond`` op,
+# which lets the whole program be captured as a single graph, like so:
 
 from functorch.experimental.control_flow import cond
 
-class Bad1Fixed(torch.nn.Module):
+class ControlFlowExample(torch.nn.Module):
     def forward(self, x):
+        # if x.sum() > 0:
+        #     return torch.sin(x)
+        # return torch.cos(x)
         def true_fn(x):
             return torch.sin(x)
         def false_fn(x):
             return torch.cos(x)
         return cond(x.sum() > 0, true_fn, false_fn, [x])
 
-exported_bad1_fixed = export(Bad1Fixed(), (torch.randn(3, 3),))
-print(exported_bad1_fixed.module()(torch.ones(3, 3)))
-print(exported_bad1_fixed.module()(-torch.ones(3, 3)))
+exported_control_flow_example = export(ControlFlowExample(), (torch.randn(3, 3),))
+print(exported_control_flow_example.module()(torch.ones(3, 3)))
+print(exported_control_flow_example.module()(-torch.ones(3, 3)))
 
 ######################################################################
 # There are limitations to ``cond`` that one should be aware of:
@@ -316,10 +328,10 @@ class MyModule2(torch.nn.Module):
         self.lin = torch.nn.Linear(100, 10)
 
     def forward(self, x, y):
-        return torch.nn.functional.relu(self.lin(x + y), inplace=True)
+        return torch.nn.functional.relu(self.lin(x + y))
 
 mod2 = MyModule2()
-exported_mod2 = export(mod2, (torch.randn(8, 100), torch.randn(8, 100)))
+exported_mod2 = export(mod2, example_args, strict=False)
 
 try:
     exported_mod2.module()(torch.randn(10, 100), torch.randn(10, 100))
@@ -364,7 +376,7 @@ dynamic_shapes1 = {
     "x": {0: inp1_dim0, 1: inp1_dim1},
 }
 
-exported_dynamic_shapes_example1 = export(DynamicShapesExample1(), (inp1,), dynamic_shapes=dynamic_shapes1)
+exported_dynamic_shapes_example1 = export(DynamicShapesExample1(), (inp1,), dynamic_shapes=dynamic_shapes1, strict=False)
 
 print(exported_dynamic_shapes_example1.module()(torch.randn(5, 5, 2)))
 
@@ -383,6 +395,20 @@ try:
 except Exception:
     tb.print_exc()
 
+######################################################################
+# Note that ``dynamic_shapes`` only applies to ``torch.export``. If we pass
+# ``exported_dynamic_shapes_example1.module()`` to ``torch.compile``, by default it
+# first compiles a graph specialized to the shape of the first input. When an input
+# with a different shape arrives, it recompiles once with dynamic shapes, and that
+# graph is then reused for later shapes. Passing ``dynamic=True`` skips the static
+# compile and produces the dynamic graph right away, so all of the shapes below
+# share a single compilation. You can check this by running the script with the
+# environment variable ``TORCH_LOGS=recompiles``.
+
+compiled_dynamic_shapes_example1 = torch.compile(exported_dynamic_shapes_example1.module(), dynamic=True)
+print(compiled_dynamic_shapes_example1(torch.randn(5, 5, 2)))
+print(compiled_dynamic_shapes_example1(torch.randn(8, 10, 2)))
+
 ######################################################################
 # Note that if our example inputs to ``torch.export`` do not satisfy the constraints
 # given by ``dynamic_shapes``, then we get an error.
@@ -393,20 +419,26 @@ dynamic_shapes1_bad = {
 }
 
 try:
-    export(DynamicShapesExample1(), (inp1,), dynamic_shapes=dynamic_shapes1_bad)
+    export(DynamicShapesExample1(), (inp1,), dynamic_shapes=dynamic_shapes1_bad, strict=False)
 except Exception:
     tb.print_exc()
 
 ######################################################################
 # We can enforce that equalities between dimensions of different tensors
-# by using the same ``torch.export.Dim`` object, for example, in matrix multiplication:
+# by using the same ``torch.export.Dim`` object, for example, in matrix multiplication
+# with a bias, where the inner dimensions of ``x`` and ``y`` must match, and the bias
+# must match the last dimension of ``y``. The printed graph contains a single
+# ``torch.ops.aten.addmm.default`` node rather than separate ``mm`` and ``add`` nodes:
 
 inp2 = torch.randn(4, 8)
 inp3 = torch.randn(8, 2)
+bias = torch.randn(2)
 
 class DynamicShapesExample2(torch.nn.Module):
-    def forward(self, x, y):
-        return x @ y
+    def forward(self, x, y, b):
+        # a single ``addmm`` lets the bias add be fused into the matmul,
+        # instead of a separate ``mm`` followed by an ``add``
+        return torch.addmm(b, x, y)
 
 inp2_dim0 = Dim("inp2_dim0")
 inner_dim = Dim("inner_dim")
@@ -415,14 +447,16 @@ inp3_dim1 = Dim("inp3_dim1")
 dynamic_shapes2 = {
     "x": {0: inp2_dim0, 1: inner_dim},
     "y": {0: inner_dim, 1: inp3_dim1},
+    "b": {0: inp3_dim1},
 }
 
-exported_dynamic_shapes_example2 = export(DynamicShapesExample2(), (inp2, inp3), dynamic_shapes=dynamic_shapes2)
+exported_dynamic_shapes_example2 = export(DynamicShapesExample2(), (inp2, inp3, bias), dynamic_shapes=dynamic_shapes2, strict=False)
+exported_dynamic_shapes_example2.graph.print_tabular()
 
-print(exported_dynamic_shapes_example2.module()(torch.randn(2, 16), torch.randn(16, 4)))
+print(exported_dynamic_shapes_example2.module()(torch.randn(2, 16), torch.randn(16, 4), torch.randn(4)))
 
 try:
-    exported_dynamic_shapes_example2.module()(torch.randn(4, 8), torch.randn(4, 2))
+    exported_dynamic_shapes_example2.module()(torch.randn(4, 8), torch.randn(4, 2), torch.randn(2))
 except Exception:
     tb.print_exc()
 
@@ -430,105 +464,88 @@ except Exception:
 # We can also describe one dimension in terms of other. There are some
 # restrictions to how detailed we can specify one dimension in terms of another,
 # but generally, those in the form of ``A * Dim + B`` should work.
+#
+# In the example below, all of the input sizes are expressed in terms of a
+# single root ``Dim``. Since exporting is much more expensive than running the
+# exported program, we export the module once and then run it on several inputs.
 
-class DerivedDimExample1(torch.nn.Module):
-    def forward(self, x, y):
-        return x + y[1:]
+class DerivedDimExample(torch.nn.Module):
+    def forward(self, x, y, z, w):
+        return x + y[1:], z[1:] + w[1::3]
 
-foo = DerivedDimExample1()
+foo = DerivedDimExample()
 
-x, y = torch.randn(5), torch.randn(6)
-dimx = torch.export.Dim("dimx", min=3, max=6)
-dimy = dimx + 1
-derived_dynamic_shapes1 = ({0: dimx}, {0: dimy})
+x, y, z, w = torch.randn(5), torch.randn(6), torch.randn(6), torch.randn(16)
+dimx = Dim("dimx", min=3, max=6)
+derived_dynamic_shapes = ({0: dimx}, {0: dimx + 1}, {0: dimx + 1}, {0: dimx * 3 + 1})
 
-derived_dim_example1 = export(foo, (x, y), dynamic_shapes=derived_dynamic_shapes1)
+derived_dim_example = export(foo, (x, y, z, w), dynamic_shapes=derived_dynamic_shapes, strict=False)
 
-print(derived_dim_example1.module()(torch.randn(4), torch.randn(5)))
+print(derived_dim_example.module()(torch.randn(4), torch.randn(5), torch.randn(5), torch.randn(13)))
+print(derived_dim_example.module()(torch.randn(6), torch.randn(7), torch.randn(7), torch.randn(19)))
 
 try:
-    derived_dim_example1.module()(torch.randn(4), torch.randn(6))
+    derived_dim_example.module()(torch.randn(4), torch.randn(6), torch.randn(5), torch.randn(13))
 except Exception:
     tb.print_exc()
 
-
-class DerivedDimExample2(torch.nn.Module):
-    def forward(self, z, y):
-        return z[1:] + y[1::3]
-
-foo = DerivedDimExample2()
-
-z, y = torch.randn(4), torch.randn(10)
-dx = torch.export.Dim("dx", min=3, max=6)
-dz = dx + 1
-dy = dx * 3 + 1
-derived_dynamic_shapes2 = ({0: dz}, {0: dy})
-
-derived_dim_example2 = export(foo, (z, y), dynamic_shapes=derived_dynamic_shapes2)
-print(derived_dim_example2.module()(torch.randn(7), torch.randn(19)))
-
 ######################################################################
-# We can actually use ``torch.export`` to guide us as to which ``dynamic_shapes`` constraints
-# are necessary. We can do this by relaxing all constraints (recall that if we
-# do not provide constraints for a dimension, the default behavior is to constrain
-# to the exact shape value of the example input) and letting ``torch.export``
-# error out.
+# Shape-dependent branches are a common source of ``dynamic_shapes`` constraints.
+# In the example below, rather than branching on ``x.shape[0]``, the module states
+# its assumption about the shape up front with ``torch._check``, so only a single
+# branch is ever traced. We then describe the same assumption, along with the
+# other relationships between the input shapes, directly in ``dynamic_shapes``:
+# ``x.shape[0]`` is at most 16, ``x.shape[1]`` must equal ``y.shape[0]``, and
+# ``y.shape[1]`` must be large enough for ``y[:, :16]``.
 
 inp4 = torch.randn(8, 16)
 inp5 = torch.randn(16, 32)
 
 class DynamicShapesExample3(torch.nn.Module):
     def forward(self, x, y):
-        if x.shape[0] <= 16:
-            return x @ y[:, :16]
-        return y
+        # instead of branching on the shape with ``if x.shape[0] <= 16:``,
+        # state the assumption up front so that only one branch is traced
+        torch._check(x.shape[0] <= 16)
+        return x @ y[:, :16]
 
+shared_dim = Dim("shared_dim")
 dynamic_shapes3 = {
-    "x": {i: Dim(f"inp4_dim{i}") for i in range(inp4.dim())},
-    "y": {i: Dim(f"inp5_dim{i}") for i in range(inp5.dim())},
+    "x": {0: Dim("inp4_dim0", max=16), 1: shared_dim},
+    "y": {0: shared_dim, 1: Dim("inp5_dim1", min=17)},
 }
 
-try:
-    export(DynamicShapesExample3(), (inp4, inp5), dynamic_shapes=dynamic_shapes3)
-except Exception:
-    tb.print_exc()
-
-######################################################################
-# We can see that the error message gives us suggested fixes to our
-# dynamic shape constraints. Let us follow those suggestions (exact
-# suggestions may differ slightly):
-
-def suggested_fixes():
-    inp4_dim1 = Dim('shared_dim')
-    # suggested fixes below
-    inp4_dim0 = Dim('inp4_dim0', max=16)
-    inp5_dim1 = Dim('inp5_dim1', min=17)
-    inp5_dim0 = inp4_dim1
-    # end of suggested fixes
-    return {
-        "x": {0: inp4_dim0, 1: inp4_dim1},
-        "y": {0: inp5_dim0, 1: inp5_dim1},
-    }
-
-dynamic_shapes3_fixed = suggested_fixes()
-exported_dynamic_shapes_example3 = export(DynamicShapesExample3(), (inp4, inp5), dynamic_shapes=dynamic_shapes3_fixed)
-print(exported_dynamic_shapes_example3.module()(torch.randn(4, 32), torch.randn(32, 64)))
-
 ######################################################################
-# Note that in the example above, because we constrained the value of ``x.shape[0]`` in
-# ``dynamic_shapes_example3``, the exported program is sound even though there is a
-# raw ``if`` statement.
+# If the constraints are not known ahead of time, you can instead mark every
+# dimension as dynamic with its own ``Dim`` and let ``torch.export`` error out:
+# the error message suggests fixes to the ``dynamic_shapes`` constraints, which
+# can be copied back into the script.
 #
-# If you want to see why ``torch.export`` generated these constraints, you can
+# To see how ``torch.export`` reasons about these constraints, you can
 # re-run the script with the environment variable ``TORCH_LOGS=dynamic,dynamo``,
-# or use ``torch._logging.set_logs``.
+# or use ``torch._logging.set_logs``. Below, we enable these logs only while
+# exporting.
 
 import logging
-torch._logging.set_logs(dynamic=logging.INFO, dynamo=logging.INFO)
-exported_dynamic_shapes_example3 = export(DynamicShapesExample3(), (inp4, inp5), dynamic_shapes=dynamic_shapes3_fixed)
+from contextlib import contextmanager
+
+@contextmanager
+def log_level(**kwargs):
+    torch._logging.set_logs(**kwargs)
+    try:
+        yield
+    finally:
+        # reset to the default log settings, even if the block raised
+        torch._logging.set_logs()
+
+with log_level(dynamic=logging.INFO, dynamo=logging.INFO):
+    exported_dynamic_shapes_example3 = export(DynamicShapesExample3(), (inp4, inp5), dynamic_shapes=dynamic_shapes3)
+print(exported_dynamic_shapes_example3.module()(torch.randn(4, 32), torch.randn(32, 64)))
 
-# reset to previous values
-torch._logging.set_logs(dynamic=logging.WARNING, dynamo=logging.WARNING)
+######################################################################
+# Note that in the example above, because the ``torch._check`` call in
+# ``DynamicShapesExample3`` replaces a raw ``if`` statement on ``x.shape[0]``,
+# the exported program contains a single branch and is sound for every shape
+# allowed by ``dynamic_shapes``, which we could write down in a single attempt.
 
 ######################################################################
 # We can view an ``ExportedProgram``'s symbolic shape ranges using the
@@ -550,7 +567,7 @@ print(exported_dynamic_shapes_example3.range_constraints)
 @torch.library.custom_op("my_custom_library::custom_op", mutates_args={})
 def custom_op(input: torch.Tensor) -> torch.Tensor:
     print("custom_op called!")
-    return torch.relu(x)
+    return torch.relu(input)
 
 ######################################################################
 # - Define a ``"Meta"`` implementation of the custom op that returns an empty
@@ -573,7 +590,7 @@ class CustomOpExample(torch.nn.Module):
 ######################################################################
 # - Export the code as before
 
-exported_custom_op_example = export(CustomOpExample(), (torch.randn(3, 3),))
+exported_custom_op_example = export(CustomOpExample(), (torch.randn(3, 3),), strict=False)
 exported_custom_op_example.graph_module.print_readable()
 print(exported_custom_op_example.module()(torch.randn(3, 3)))
 
@@ -584,7 +601,50 @@ print(exported_custom_op_example.module()(torch.randn(3, 3)))
 #
 # If you have a custom operator implemented in C++, please refer to
 # `this document <https://docs.google.com/document/d/1_W62p8WJOQQUzPsJYa7s701JXt0qf2OfLub2sbkHOaU/edit#heading=h.ahugy69p2jmz>`__
-# to make it compatible with ``torch.export``.
+# to make it compatible with ``torch.export``. Similarly, a kernel that is exposed to
+# Python through a raw ``pybind`` C-extension should be wrapped in a
+# ``torch.library.custom_op``; otherwise TorchDynamo cannot trace into it and
+# reports an ``unsupported builtin`` graph break, instead of recording it as a
+# single op in the graph as we saw above.
+#
+# Calling ``exported_custom_op_example.module()`` runs every operator through
+# Python. The exported program can also be compiled ahead of time with
+# AOTInductor (covered in more detail in the `Running the Exported Program`_
+# section below). This only removes the Python overhead of the operators around
+# the custom op: ``torch.sin`` and ``torch.cos`` are compiled into the shared
+# library, but ``custom_op`` is implemented in Python (it prints and calls
+# ``torch.relu``), so the compiled library still calls back into Python for it
+# on every call. The snippet below is not run as part of this tutorial:
+#
+# .. code-block:: python
+#
+#    import torch._export
+#    import torch._inductor
+#
+#    x = torch.randn(3, 3)
+#    so_path = torch._inductor.aot_compile(exported_custom_op_example.module(), (x,))
+#    print(torch._export.aot_load(so_path, device="cpu")(x))
+
+######################################################################
+# .. note::
+#
+#     The body of a ``torch.library.custom_op`` is opaque to tracing, so it can
+#     query anything it needs at runtime. The code around the call site, such as
+#     ``forward``, is traced, however. If it queries runtime information that
+#     does not change during the program, such as the device capability or which
+#     backend to use, compute it once at module scope and reference the
+#     resulting constant instead. A module-level constant is treated as a plain
+#     Python value when tracing, whereas the query itself (even when wrapped in
+#     ``functools.lru_cache``) is an opaque call that can cause a graph break
+#     under ``torch.compile(fullgraph=True)``:
+#
+#     .. code-block:: python
+#
+#         _CAPABILITY = torch.cuda.get_device_capability() if torch.cuda.is_available() else None
+#
+#         def forward(self, x):
+#             if _CAPABILITY is not None and _CAPABILITY >= (8, 0):
+#                 ...
 
 ######################################################################
 # Decompositions
@@ -633,11 +693,13 @@ class M(torch.nn.Module):
     def forward(self, x):
         return self.linear(x)
 
-ep = export(M(), (torch.randn(2, 3),))
-print(ep.graph)
+# ``ep``, exported from this instance of ``M``, is reused by the decomposition examples below
+m = M()
+ep = export(m, (torch.randn(2, 3),), strict=False)
+ep.graph.print_tabular()
 
 core_ir_ep = ep.run_decompositions()
-print(core_ir_ep.graph)
+core_ir_ep.graph.print_tabular()
 
 ######################################################################
 # Notice that after running ``run_decompositions`` the
@@ -645,29 +707,34 @@ print(core_ir_ep.graph)
 # Opset, has been replaced with ``torch.ops.aten.permute.default`` which is part
 # of the Core ATen Opset.
 #
+# Running decompositions can be expensive for large graphs, so rather than
+# repeating it every time the program is deployed, we can save the decomposed
+# ``ExportedProgram`` with ``torch.export.save`` and load it back later with
+# ``torch.export.load``. The example inputs used for export are saved along
+# with the program.
+
+torch.export.save(core_ir_ep, "m_core.pt2")
+loaded_core_ir_ep = torch.export.load("m_core.pt2")
+loaded_core_ir_ep.graph.print_tabular()
+print(loaded_core_ir_ep.example_inputs)
+
+######################################################################
 # Most ATen operators already have decompositions, which are located
 # `here <https://github.com/pytorch/pytorch/blob/b460c3089367f3fadd40aa2cb3808ee370aa61e1/torch/_decomp/decompositions.py>`__.
 # If you would like to use some of these existing decomposition functions,
 # you can pass in a list of operators you would like to decompose to the
 # `get_decompositions <https://github.com/pytorch/pytorch/blob/b460c3089367f3fadd40aa2cb3808ee370aa61e1/torch/_decomp/__init__.py#L191>`__
 # function, which will return a decomposition table using existing
-# decomposition implementations.
-
-class M(torch.nn.Module):
-    def __init__(self):
-        super().__init__()
-        self.linear = torch.nn.Linear(3, 4)
+# decomposition implementations. Below, we only ask for decompositions of
+# ``torch.ops.aten.t.default`` and ``torch.ops.aten.transpose.int``, so every
+# other operator in the graph is left as is.
 
-    def forward(self, x):
-        return self.linear(x)
-
-ep = export(M(), (torch.randn(2, 3),))
-print(ep.graph)
+# Here we reuse ``ep``, the exported program of ``m`` from above.
 
 from torch._decomp import get_decompositions
 decomp_table = get_decompositions([torch.ops.aten.t.default, torch.ops.aten.transpose.int])
 core_ir_ep = ep.run_decompositions(decomp_table)
-print(core_ir_ep.graph)
+core_ir_ep.graph.print_tabular()
 
 ######################################################################
 # If there is no existing decomposition function for an ATen operator that you would
@@ -722,42 +789,49 @@ def cond_predicate(x):
 # `AOTInductor <https://pytorch.org/docs/main/torch.compiler_aot_inductor.html>`__,
 # or `TensorRT <https://pytorch.org/TensorRT/dynamo/dynamo_export.html>`__.
 
-class M(torch.nn.Module):
-    def __init__(self):
-        super().__init__()
-        self.linear = torch.nn.Linear(3, 3)
-
-    def forward(self, x):
-        x = self.linear(x)
-        return x
-
+# We export a new instance of ``M`` from the Decompositions section on the GPU,
+# rather than moving ``m``, whose parameters the programs exported there still hold.
+# Put the model in ``eval`` mode before exporting, so that the exported graph
+# (and the inference-only optimizations applied to it) reflect inference behavior
 inp = torch.randn(2, 3, device="cuda")
-m = M().to(device="cuda")
-ep = torch.export.export(m, (inp,))
-
-# Run it eagerly
-res = ep.module()(inp)
-print(res)
-
-# Run it with torch.compile
-res = torch.compile(ep.module(), backend="inductor")(inp)
+m = M().to(device="cuda").eval()
+ep = torch.export.export(m, (inp,), strict=False)
+
+######################################################################
+# Rather than calling ``ep.module()`` eagerly, or recompiling it with
+# ``torch.compile`` in every new process, we can compile the exported program
+# ahead of time with AOTInductor. ``torch._inductor.aot_compile`` compiles the
+# program once into a shared library, and ``torch._export.aot_load`` loads the
+# shared library back as a callable. The loaded model executes through a
+# generated C++ wrapper, so no Python is involved in the actual runtime
+# execution, and no compilation happens at load time.
+
+import torch._export
+import torch._inductor
+
+# Note: these APIs are subject to change
+# Compile the exported program to a .so using ``AOTInductor``
+with torch.no_grad():
+    so_path = torch._inductor.aot_compile(ep.module(), (inp,))
+
+# Load and run the .so file in Python.
+# To load and run it in a C++ environment, see:
+# https://pytorch.org/docs/main/torch.compiler_aot_inductor.html
+res = torch._export.aot_load(so_path, device="cuda")(inp)
 print(res)
 
 ######################################################################
-# .. code-block:: python
+# If you would rather compile just-in-time in the current process, you can
+# also pass ``ep.module()`` to ``torch.compile``. For small inputs like these,
+# ``mode="reduce-overhead"`` is recommended. ``M`` is a single ``nn.Linear``,
+# so there is little for Inductor to fuse; the benefit mainly comes from
+# capturing the kernel launches with CUDA graphs, which removes most of the
+# launch overhead.
 #
-#    import torch._export
-#    import torch._inductor
-#
-#    # Note: these APIs are subject to change
-#    # Compile the exported program to a .so using ``AOTInductor``
-#    with torch.no_grad():
-#    so_path = torch._inductor.aot_compile(ep.module(), [inp])
+# .. code-block:: python
 #
-#    # Load and run the .so file in Python.
-#    # To load and run it in a C++ environment, see:
-#    # https://pytorch.org/docs/main/torch.compiler_aot_inductor.html
-#    res = torch._export.aot_load(so_path, device="cuda")(inp)
+#    compiled = torch.compile(ep.module(), mode="reduce-overhead")
+#    res = compiled(inp)
 
 ######################################################################
 # Conclusion
@@ -77,6 +77,13 @@ print(f"weight in optimizer: {optimizer.param_groups[0]['params']}")
 aten = torch.ops.aten
 
 class MyQuantizedLinearWeight(torch.Tensor):
+    # Every op on the subclass goes through ``__torch_dispatch__``, so the
+    # lookup tables are built once here rather than on every call.
+    _PASSTHROUGH = frozenset({aten.detach.default, aten._to_copy.default})
+    # Implementations for certain ops would be added to ``_OP_TABLE``.
+    # We omit this for brevity.
+    _OP_TABLE = {}
+
     @staticmethod
     def __new__(cls, elem, scale):
         return torch.Tensor._make_wrapper_subclass(
@@ -97,14 +104,13 @@ class MyQuantizedLinearWeight(torch.Tensor):
 
     @classmethod
     def __torch_dispatch__(cls, func, types, args, kwargs):
-        if func in (aten.detach.default, aten._to_copy.default):
+        if func in cls._PASSTHROUGH:
+            # The old payload stays alive for as long as the old wrapper does
             new_elem = func(args[0].elem, *args[1:], **kwargs)
             return cls(new_elem, args[0].scale)
-        # Implementations for certain ops would be added to ``OP_TABLE``.
-        # We omit this for brevity.
-        OP_TABLE = dict()
-        if func in OP_TABLE:
-          return OP_TABLE[func](func, args, kwargs)
+        handler = cls._OP_TABLE.get(func)
+        if handler is not None:
+            return handler(func, args, kwargs)
         raise NotImplementedError(f"Unsupported function {func}")
 
 #################################################################################
@@ -141,6 +147,24 @@ print(f"m.weight.elem.dtype: {m.weight.elem.dtype}")
 print(f"m.bias.dtype: {m.bias.dtype}")
 torch.__future__.set_swap_module_params_on_conversion(False)
 
+################################################################################
+# The config also applies when moving a module to another device, such as the
+# GPU, with ``nn.Module.to()``. Without it, ``.data`` setting would leave the payload of ``MyQuantizedLinearWeight``
+# on the CPU, just as it left the payload's ``dtype`` unchanged above. With it,
+# each parameter is swapped with its copy on the GPU, so the payload moves
+# too, while references held elsewhere (such as by the optimizer) still point
+# at the module's parameters. Buffers are moved by ``nn.Module.to()`` as well.
+
+if torch.cuda.is_available():
+    torch.__future__.set_swap_module_params_on_conversion(True)
+    m = nn.Linear(3, 5)
+    m.weight = torch.nn.Parameter(MyQuantizedLinearWeight(m.weight, 0.5))
+    optimizer = torch.optim.SGD(m.parameters())
+    m.to("cuda")
+    print(f"m.weight.elem.device: {m.weight.elem.device}")
+    print(f"optimizer still references m.weight: {optimizer.param_groups[0]['params'][0] is m.weight}")
+    torch.__future__.set_swap_module_params_on_conversion(False)
+
 ################################################################################
 # ``nn.Module.load_state_dict()``
 # --------------------------------
@@ -181,17 +205,39 @@ torch.__future__.set_swap_module_params_on_conversion(False)
 # can define a ``__torch_function__`` handler for ``torch.Tensor.module_load``
 # as such:
 
+# ``module_load`` is called once per parameter, so the transformation to apply
+# is looked up by the exact types of the parameter and the ``state_dict`` value.
+# Exact-type matching is intended: a subclass of ``MyQuantizedLinearWeight``
+# would add its own entries rather than silently inheriting these.
+
+def _load_quantized(dest, src):
+    # ``src`` is already quantized; reinterpreting its payload under a
+    # different scale would silently change its values
+    if src.scale != dest.scale:
+        raise ValueError(
+            f"Cannot load a weight quantized with scale {src.scale} into a parameter with scale {dest.scale}")
+    return src
+
+_MODULE_LOAD_DISPATCH = {
+    # plain tensors are wrapped with the scale of the parameter
+    (MyQuantizedLinearWeight, torch.Tensor):
+        lambda dest, src: MyQuantizedLinearWeight(src, dest.scale),
+    (MyQuantizedLinearWeight, MyQuantizedLinearWeight): _load_quantized,
+}
+
 @classmethod
 def custom_torch_function(cls, func, types, args=(), kwargs=None):
     kwargs = {} if kwargs is None else kwargs
 
     if func is torch.Tensor.module_load:
         dest, src = args[0], args[1]
-        assert type(dest) == cls and type(src) == torch.Tensor
-        return MyQuantizedLinearWeight(src, dest.scale)
+        handler = _MODULE_LOAD_DISPATCH.get((type(dest), type(src)))
+        if handler is None:
+            raise NotImplementedError(
+                f"Unsupported module_load from {type(src).__name__} to {type(dest).__name__}")
+        return handler(dest, src)
     else:
-        with torch._C.DisableTorchFunctionSubclass():
-                return func(*args, **kwargs)
+        return torch._C._disabled_torch_function_impl(func, types, args, kwargs)
 
 MyQuantizedLinearWeight.__torch_function__ = custom_torch_function
 
@@ -199,17 +245,30 @@ MyQuantizedLinearWeight.__torch_function__ = custom_torch_function
 # First, let us create a skeleton of a model on the meta device to avoid
 # materializing storages. We convert all weights in the modules to
 # ``MyQuantizedLinearWeight`` subclasses while leaving biases intact.
-
-def fn(m):
-    if isinstance(m, nn.Linear):
-        requires_grad = m.weight.requires_grad
-        m.weight = torch.nn.Parameter(
-                    MyQuantizedLinearWeight(m.weight, 0.5), requires_grad=requires_grad
-                   )
+#
+# Rather than assigning a new ``nn.Parameter`` to each module, which goes
+# through ``nn.Module.__setattr__`` and its parameter bookkeeping for every
+# layer, we construct all of the new weights up front and swap each one into
+# the existing parameter with ``swap_tensors``. The payload is a detached view
+# of the original weight, so that it does not refer to the object being swapped.
+# The conversion is wrapped in a function so that the swapped-out parameters
+# are released as soon as it returns.
 
 with torch.device("meta"):
     m = nn.Linear(3, 5)
-    m.apply(fn)
+
+def quantize_linear_weights_(module):
+    linears = [mod for mod in module.modules() if isinstance(mod, nn.Linear)]
+    new_weights = [
+        torch.nn.Parameter(
+            MyQuantizedLinearWeight(mod.weight.detach(), 0.5), requires_grad=mod.weight.requires_grad
+        )
+        for mod in linears
+    ]
+    for mod, new_weight in zip(linears, new_weights):
+        torch.utils.swap_tensors(mod.weight, new_weight)
+
+quantize_linear_weights_(m)
 
 #################################################################################
 # We can then load the ``state_dict``. Observe that we use ``assign=True`` because
@@ -233,6 +292,24 @@ print(f"m.state_dict() after load_state_dict():\n {m.state_dict()}")
 # case, we can define the ``__torch_function__`` handler for ``module_load``
 # to apply the transforms as needed.
 #
+# Since ``assign=True`` preserves the device of the tensors in the ``state_dict``,
+# loading the skeleton onto a GPU amounts to moving the ``state_dict`` there first.
+# If the ``state_dict`` already lives in pinned memory (for example, because it
+# was loaded straight into pinned buffers), the host-to-device copies can be
+# issued with ``non_blocking=True``. The copies still run one after another on
+# the current stream, but the host does not wait for each of them, so it can
+# keep working (for example, loading the next checkpoint shard) while they run.
+# Calling ``pin_memory()`` right before the copies would not help, since pinning
+# is itself a synchronous copy on the host. No explicit synchronization is
+# needed before ``load_state_dict``, since any later use of the parameters on
+# the same stream is ordered after the copies:
+#
+# .. code-block:: python
+#
+#     # ``pinned_state_dict`` was loaded into pinned memory ahead of time
+#     state_dict = {k: v.to("cuda", non_blocking=True) for k, v in pinned_state_dict.items()}
+#     m.load_state_dict(state_dict, assign=True)
+#
 # Conclusion
 # ----------
 # In this recipe, we learned about ``swap_tensors``, the importance